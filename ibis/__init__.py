@@ -47,6 +47,13 @@ with ibis.config.config_prefix('sql'):
         10_000,
         'Number of rows to be retrieved for an unlimited table expression',
     )
+    ibis.config.register_option(
+        'stream_results',
+        True,
+        'Whether to fetch query results with server side cursors, for '
+        'the SQLAlchemy backends that support them',
+        validator=ibis.config.is_bool,
+    )
 
 __version__ = get_versions()['version']
 del get_versions
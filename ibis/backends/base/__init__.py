@@ -13,6 +13,9 @@ class BaseBackend(abc.ABC):
     and implement all the required methods.
     """
 
+    # maximum number of compiled expressions kept by `compile`
+    compile_cache_size = 128
+
     @property
     @abc.abstractmethod
     def name(self) -> str:
@@ -54,8 +57,17 @@ class BaseBackend(abc.ABC):
         Dialect class of the backend.
 
         We generate it dynamically to avoid repeating the code for each
-        backend.
-        """
+        backend. The class is built the first time it is requested and
+        cached on the backend class, since `compile` looks it up for every
+        expression.
+        """
+        cls = type(self)
+        dialect_class = cls.__dict__.get('_dialect_class')
+        if dialect_class is None:
+            dialect_class = cls._dialect_class = self._make_dialect()
+        return dialect_class
+
+    def _make_dialect(self):
         # TODO importing dialects inside the function to avoid circular
         # imports. In the future instead of this if statement we probably
         # want to create subclasses for each of the kinds
@@ -63,11 +75,11 @@ class BaseBackend(abc.ABC):
         if self.kind == 'sqlalchemy':
             from ibis.backends.base.sql.alchemy import AlchemyDialect
 
-            dialect_class = AlchemyDialect
+            base_class = AlchemyDialect
         elif self.kind in ('sql', 'pandas', 'spark'):
             from ibis.backends.base.sql.compiler import Dialect
 
-            dialect_class = Dialect
+            base_class = Dialect
         else:
             raise ValueError(
                 f'Backend class "{self.kind}" unknown. '
@@ -75,8 +87,13 @@ class BaseBackend(abc.ABC):
                 '"pandas" or "spark".'
             )
 
-        dialect_class.translator = self.translator
-        return dialect_class
+        # subclass instead of setting the translator on the shared base
+        # class, so backends of the same kind don't overwrite each other
+        return type(
+            f'{self.name.capitalize()}Dialect',
+            (base_class,),
+            {'translator': self.translator},
+        )
 
     @abc.abstractmethod
     def connect(connection_string, **options):
@@ -95,7 +112,28 @@ class BaseBackend(abc.ABC):
     def compile(self, expr, params=None):
         """
         Compile the expression.
+
+        Results are cached by the structure of `expr` and `params`, so
+        compiling an equal expression again skips the builder. The cache is
+        discarded whenever a rule is registered through `add_operation` or
+        the translator's registration hooks.
         """
+        key = self._compile_cache_key(expr, params)
+        if key is None:
+            return self._compile(expr, params=params)
+
+        self._invalidate_compile_cache_if_rules_changed()
+        cache = self._compile_cache
+        try:
+            # re-insert on hit, so the dict stays ordered by recent use
+            compiled = cache[key] = cache.pop(key)
+        except KeyError:
+            compiled = cache[key] = self._compile(expr, params=params)
+            if len(cache) > self.compile_cache_size:
+                del cache[next(iter(cache))]
+        return compiled
+
+    def _compile(self, expr, params=None):
         context = self.dialect.make_context(params=params)
         builder = self.builder(expr, context=context)
         query_ast = builder.get_result()
@@ -105,6 +143,42 @@ class BaseBackend(abc.ABC):
         compiled = query_ast.compile()
         return compiled
 
+    @property
+    def _compile_cache(self):
+        try:
+            return self._compiled_exprs
+        except AttributeError:
+            self._compiled_exprs = {}
+            return self._compiled_exprs
+
+    @staticmethod
+    def _compile_cache_key(expr, params):
+        if params is None:
+            params = {}
+        key = (
+            expr._key,
+            tuple((param.op(), value) for param, value in params.items()),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            # unhashable literal or parameter values can't be cached
+            return None
+        return key
+
+    def _invalidate_compile_cache_if_rules_changed(self):
+        # translators count the rules registered through their hooks
+        version = getattr(self.translator, '_rules_version', None)
+        if version != getattr(self, '_compile_cache_rules_version', None):
+            self.invalidate_compile_cache()
+            self._compile_cache_rules_version = version
+
+    def invalidate_compile_cache(self):
+        """
+        Discard all the cached results of `compile`.
+        """
+        self._compile_cache.clear()
+
     def verify(self, expr, params=None):
         """
         Verify `expr` is an expression that can be compiled.
@@ -135,5 +209,6 @@ class BaseBackend(abc.ABC):
 
         def decorator(translation_function):
             self.translator.add_operation(operation, translation_function)
+            self.invalidate_compile_cache()
 
         return decorator
@@ -1,10 +1,14 @@
 import contextlib
 import functools
-from typing import List, Optional, Union
+import inspect
+import itertools
+import re
+import weakref
+from typing import Iterable, List, Optional, Pattern, Union
 
+import numpy as np
 import pandas as pd
 import sqlalchemy as sa
-from pkg_resources import parse_version
 
 import ibis
 import ibis.expr.datatypes as dt
@@ -13,31 +17,32 @@ import ibis.expr.types as ir
 import ibis.util as util
 from ibis.backends.base.sql.compiler import Dialect
 from ibis.client import Query, SQLClient
+from ibis.config import options
 
 from .datatypes import to_sqla_type
 from .geospatial import geospatial_supported
 from .query_builder import build_ast
 from .translator import AlchemyExprTranslator
 
-if geospatial_supported:
-    import geoalchemy2.shape as shape
-    import geopandas
-
 
 class _AlchemyProxy:
     """
-    Wraps a SQLAlchemy ResultProxy and ensures that .close() is called on
-    garbage collection
+    Wraps a SQLAlchemy ResultProxy and ensures that .close() is called when
+    leaving the context manager.
+
+    Proxies that are never closed explicitly are closed by a finalizer when
+    garbage collected, but this is only a safety net: the cursor may be held
+    for an arbitrary amount of time, so use the proxy with ``with``.
     """
 
     def __init__(self, proxy):
         self.proxy = proxy
-
-    def __del__(self):
-        self._close_cursor()
+        # unlike __del__, the finalizer runs at most once, whether called
+        # explicitly or on collection, and can't resurrect the proxy
+        self._finalizer = weakref.finalize(self, proxy.close)
 
     def _close_cursor(self):
-        self.proxy.close()
+        self._finalizer()
 
     def __enter__(self):
         return self
@@ -54,11 +59,16 @@ def _invalidates_reflection_cache(f):
     that mutates database or table metadata such as ``CREATE TABLE``,
     ``DROP TABLE``, etc.
 
+    If `f` takes a ``name`` or ``table_name`` argument, only the cached
+    metadata of that table, and the lists of table names, are invalidated.
+    Otherwise, e.g. for ``raw_sql``, the whole cache is invalidated.
+
     Parameters
     ----------
     f : callable
         A method on :class:`ibis.sql.alchemy.AlchemyClient`
     """
+    signature = inspect.signature(f)
 
     @functools.wraps(f)
     def wrapped(self, *args, **kwargs):
@@ -66,7 +76,12 @@ def _invalidates_reflection_cache(f):
 
         # only invalidate the cache after we've succesfully called the wrapped
         # function
-        self._reflection_cache_is_dirty = True
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        table_name = arguments.get('table_name', arguments.get('name'))
+        if table_name is None:
+            self._reflection_cache_is_dirty = True
+        else:
+            self._dirty_tables.add(table_name)
         return result
 
     return wrapped
@@ -79,28 +94,95 @@ def _maybe_to_geodataframe(df, schema):
     GeoDataFrame.
     """
 
-    def to_shapely(row, name):
-        return shape.to_shape(row[name]) if row[name] is not None else None
-
     if len(df) and geospatial_supported:
-        geom_col = None
-        for name, dtype in schema.items():
-            if isinstance(dtype, dt.GeoSpatial):
-                geom_col = geom_col or name
-                df[name] = df.apply(lambda x: to_shapely(x, name), axis=1)
-        if geom_col:
-            df = geopandas.GeoDataFrame(df, geometry=geom_col)
+        geom_cols = schema.geospatial_columns
+        if not geom_cols:
+            return df
+
+        import geoalchemy2.shape as shape
+        import geopandas
+
+        for name in geom_cols:
+            df[name] = geopandas.GeoSeries(
+                df[name].map(shape.to_shape, na_action='ignore')
+            )
+        # the columns are already geometries, so this doesn't need to
+        # convert or copy them again
+        df = geopandas.GeoDataFrame(df, geometry=geom_cols[0], copy=False)
     return df
 
 
+def _like_matcher(like):
+    """Return a predicate checking whether a table name matches `like`."""
+    if isinstance(like, str):
+        return lambda name: like in name
+    if isinstance(like, re.Pattern):
+        return like.search
+    # a single alternation finds any of the substrings in one scan of each
+    # name, and re caches the compiled pattern across calls
+    patterns = list(like)
+    if not patterns:
+        return lambda name: False
+    return re.compile('|'.join(map(re.escape, patterns))).search
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_server_version(server_version_info):
+    from pkg_resources import parse_version
+
+    return parse_version('.'.join(map(str, server_version_info)))
+
+
+def _column_from_values(values, dtype):
+    """Build a column from a list of database values, converting decimals to
+    floats like ``pd.DataFrame.from_records(..., coerce_float=True)``.
+
+    Numeric columns are built directly with the numpy dtype of `dtype` when
+    possible, so that ``Schema.apply_to`` doesn't have to convert them again.
+    """
+    if not values:
+        return pd.Series(values, dtype=object)
+
+    if isinstance(dtype, (dt.Integer, dt.Floating)):
+        try:
+            return pd.Series(np.array(values, dtype=dtype.to_pandas()))
+        except (TypeError, ValueError):
+            # NULLs in an integer column, or values numpy can't convert
+            pass
+
+    column = pd.Series(values)
+    if (
+        column.dtype == np.object_
+        and pd.api.types.infer_dtype(column, skipna=True) == 'decimal'
+    ):
+        column = column.astype(np.float64)
+    return column
+
+
 class AlchemyQuery(Query):
+
+    fetch_size = 10_000
+
     def _fetch(self, cursor):
-        df = pd.DataFrame.from_records(
-            cursor.proxy.fetchall(),
-            columns=cursor.proxy.keys(),
-            coerce_float=True,
-        )
+        proxy = cursor.proxy
+        keys = proxy.keys()
+
+        # build the result column-wise, one batch of rows at a time, so we
+        # never hold the full list of row tuples and transpose it afterwards
+        values = [[] for _ in keys]
+        rows = proxy.fetchmany(self.fetch_size)
+        while rows:
+            for column, batch in zip(values, zip(*rows)):
+                column.extend(batch)
+            rows = proxy.fetchmany(self.fetch_size)
+
         schema = self.schema()
+        types = (schema[key] if key in schema else None for key in keys)
+        df = pd.DataFrame(
+            dict(enumerate(map(_column_from_values, values, types))),
+            columns=range(len(keys)),
+        )
+        df.columns = keys
         return _maybe_to_geodataframe(schema.apply_to(df), schema)
 
 
@@ -114,6 +196,13 @@ class AlchemyClient(SQLClient):
     dialect = AlchemyDialect
     query_class = AlchemyQuery
     has_attachment = False
+    supports_truncate = False
+    supports_server_side_cursors = False
+    # SQLite's default limit on bound parameters per statement, the lowest
+    # among the supported databases
+    max_insert_params = 999
+    # maximum number of compiled selects kept for inserts from expressions
+    compiled_selects_cache_size = 128
 
     def __init__(self, con: sa.engine.Engine) -> None:
         super().__init__()
@@ -121,12 +210,65 @@ class AlchemyClient(SQLClient):
         self.meta = sa.MetaData(bind=con)
         self._inspector = sa.inspect(con)
         self._reflection_cache_is_dirty = False
+        self._dirty_tables = set()
         self._schemas = {}
+        self._compiled_selects = {}
 
-    @property
-    def inspector(self):
+    def _clear_reflection_cache_if_dirty(self):
         if self._reflection_cache_is_dirty:
             self._inspector.info_cache.clear()
+            # reflected tables are kept in the metadata
+            self.meta.clear()
+        elif self._dirty_tables:
+            self._clear_table_reflection_cache(self._dirty_tables)
+        else:
+            return
+
+        self._compiled_selects.clear()
+        self._reflection_cache_is_dirty = False
+        self._dirty_tables.clear()
+
+    def _clear_table_reflection_cache(self, table_names):
+        # the keys of the inspector cache are tuples of the name of the
+        # reflection method and its string arguments: drop the entries about
+        # the given tables, and the lists of names (`get_table_names`, etc.)
+        info_cache = self._inspector.info_cache
+        for key in list(info_cache):
+            method_name, args = key[0], key[1]
+            lists_names = method_name.endswith('_names')
+            if lists_names or not table_names.isdisjoint(args):
+                del info_cache[key]
+
+        # along with the tables kept in the metadata
+        for table in list(self.meta.tables.values()):
+            if table.name in table_names:
+                self.meta.remove(table)
+
+    def _compiled_for(self, expr):
+        """Compile `expr` to a SQLAlchemy selectable, reusing the result of
+        recent compilations of an equal expression.
+
+        The compiled selects are discarded by DDL, which may change the
+        reflected tables they refer to.
+        """
+        self._clear_reflection_cache_if_dirty()
+        cache = self._compiled_selects
+        try:
+            key = expr._key
+            # re-insert on hit, so the dict stays ordered by recent use
+            compiled = cache[key] = cache.pop(key)
+        except TypeError:
+            # unhashable expression
+            return expr.compile()
+        except KeyError:
+            compiled = cache[key] = expr.compile()
+            if len(cache) > self.compiled_selects_cache_size:
+                del cache[next(iter(cache))]
+        return compiled
+
+    @property
+    def inspector(self):
+        self._clear_reflection_cache_if_dirty()
         return self._inspector
 
     @contextlib.contextmanager
@@ -163,12 +305,15 @@ class AlchemyClient(SQLClient):
             name, schema, database=database or self.current_database
         )
 
+        # compile before opening the transaction, to keep it short; this is
+        # DDL, so caching the compiled select would be pointless
+        if expr is not None:
+            insert = t.insert().from_select(list(expr.columns), expr.compile())
+
         with self.begin() as bind:
             t.create(bind=bind)
             if expr is not None:
-                bind.execute(
-                    t.insert().from_select(list(expr.columns), expr.compile())
-                )
+                bind.execute(insert)
 
     def _columns_from_schema(
         self, name: str, schema: sch.Schema
@@ -223,6 +368,7 @@ class AlchemyClient(SQLClient):
         data: pd.DataFrame,
         database: str = None,
         if_exists: str = 'fail',
+        chunksize: Optional[int] = None,
     ):
         """
         Load data from a dataframe to the backend.
@@ -234,6 +380,9 @@ class AlchemyClient(SQLClient):
         database : string, optional
         if_exists : string, optional, default 'fail'
             The values available are: {‘fail’, ‘replace’, ‘append’}
+        chunksize : int, optional
+            Number of rows written per ``INSERT`` statement. By default, as
+            many rows as fit in the maximum number of bound parameters.
 
         Raises
         ------
@@ -251,58 +400,124 @@ class AlchemyClient(SQLClient):
                 'yet implemented'
             )
 
+        self._write_dataframe(
+            table_name, data, if_exists=if_exists, chunksize=chunksize
+        )
+
+    def _write_dataframe(
+        self,
+        table_name: str,
+        data: pd.DataFrame,
+        if_exists: str,
+        chunksize: Optional[int] = None,
+    ) -> None:
         params = {}
         if self.has_attachment:
             # for database with attachment
             # see: https://github.com/ibis-project/ibis/issues/1930
             params['schema'] = self.database_name
 
+        if chunksize is None:
+            chunksize = max(
+                1, self.max_insert_params // max(1, len(data.columns))
+            )
+
+        # write many rows per INSERT statement instead of one statement per
+        # row, which saves a round trip per row on networked databases
         data.to_sql(
             table_name,
             con=self.con,
             index=False,
             if_exists=if_exists,
+            method='multi',
+            chunksize=chunksize,
             **params,
         )
 
     def truncate_table(
         self, table_name: str, database: Optional[str] = None
     ) -> None:
+        """
+        Delete all the rows of a table.
+
+        Backends that set ``supports_truncate`` issue ``TRUNCATE TABLE``,
+        which drops the data at once instead of deleting (and logging) every
+        row. Its semantics differ from ``DELETE``: it doesn't fire ``ON
+        DELETE`` triggers, and PostgreSQL rejects it on a table referenced by
+        a foreign key. The other backends issue ``DELETE``.
+
+        Parameters
+        ----------
+        table_name : string
+            name of the table to truncate
+        database : string, optional
+            name of the database that the table is located in
+        """
         t = self._get_sqla_table(table_name, schema=database)
-        t.delete().execute()
+        if self.supports_truncate:
+            quoted_name = self.con.dialect.identifier_preparer.format_table(t)
+            self.con.execute(f'TRUNCATE TABLE {quoted_name}')
+        else:
+            t.delete().execute()
 
     def list_tables(
         self,
-        like: Optional[str] = None,
+        like: Union[str, Iterable[str], Pattern, None] = None,
         database: Optional[str] = None,
         schema: Optional[str] = None,
+        kind: str = 'both',
     ) -> List[str]:
         """List tables/views in the current or indicated database.
 
         Parameters
         ----------
         like
-            Checks for this string contained in name
+            Checks for this string contained in name. If an iterable of
+            strings is passed, names containing any of them are listed; if a
+            compiled regular expression is passed, names it matches anywhere
+            are listed
         database
             If not passed, uses the current database
         schema
             The schema namespace that tables should be listed from
+        kind
+            One of ``'table'``, ``'view'`` or ``'both'``. Only the requested
+            kinds of objects are queried from the database
 
         Returns
         -------
         List[str]
 
         """
+        if kind not in ('table', 'view', 'both'):
+            raise ValueError(
+                f'Invalid kind {kind!r}, expected one of '
+                '"table", "view" or "both"'
+            )
+
         inspector = self.inspector
-        # inspector returns a mutable version of its names, so make a copy.
-        names = inspector.get_table_names(schema=schema).copy()
-        names.extend(inspector.get_view_names(schema=schema))
+        tables = views = ()
+        if kind in ('table', 'both'):
+            tables = inspector.get_table_names(schema=schema)
+        if kind in ('view', 'both'):
+            views = inspector.get_view_names(schema=schema)
+
+        names = itertools.chain(tables, views)
         if like is not None:
-            names = [x for x in names if like in x]
+            names = filter(_like_matcher(like), names)
         return sorted(names)
 
     def _execute(self, query: str, results: bool = True):
-        return _AlchemyProxy(self.con.execute(query))
+        con = self.con
+        if (
+            results
+            and self.supports_server_side_cursors
+            and options.sql.stream_results
+        ):
+            # fetch the rows in batches as AlchemyQuery consumes them,
+            # instead of buffering the whole result set in the driver
+            con = con.execution_options(stream_results=True)
+        return _AlchemyProxy(con.execute(query))
 
     @_invalidates_reflection_cache
     def raw_sql(self, query: str, results: bool = False):
@@ -312,6 +527,11 @@ class AlchemyClient(SQLClient):
         return build_ast(expr, context)
 
     def _log(self, sql):
+        # rendering the statement walks the whole SQLAlchemy construct, so
+        # don't do it unless it's going to be logged
+        if not options.verbose:
+            return
+
         try:
             query_str = str(sql)
         except sa.exc.UnsupportedCompilationError:
@@ -320,7 +540,13 @@ class AlchemyClient(SQLClient):
             util.log(query_str)
 
     def _get_sqla_table(self, name, schema=None, autoload=True):
-        return sa.Table(name, self.meta, schema=schema, autoload=autoload)
+        if not autoload:
+            return sa.Table(name, self.meta, schema=schema, autoload=False)
+
+        # the metadata keeps reflected tables, so reflecting is only a round
+        # trip to the database until some DDL invalidates them
+        self._clear_reflection_cache_if_dirty()
+        return sa.Table(name, self.meta, schema=schema, autoload=True)
 
     def _sqla_table_to_expr(self, table):
         node = self.table_class(table, self)
@@ -328,8 +554,7 @@ class AlchemyClient(SQLClient):
 
     @property
     def version(self):
-        vstring = '.'.join(map(str, self.con.dialect.server_version_info))
-        return parse_version(vstring)
+        return _parse_server_version(self.con.dialect.server_version_info)
 
     def insert(
         self,
@@ -337,6 +562,7 @@ class AlchemyClient(SQLClient):
         obj: Union[pd.DataFrame, ir.TableExpr],
         database: Optional[str] = None,
         overwrite: Optional[bool] = False,
+        chunksize: Optional[int] = None,
     ) -> None:
         """
         Insert the given data to a table in backend.
@@ -354,6 +580,10 @@ class AlchemyClient(SQLClient):
             name of the attached database that the table is located in.
         overwrite : boolean, default False
             If True, will replace existing contents of table else not
+        chunksize : int, optional
+            Number of rows written per ``INSERT`` statement when `obj` is a
+            DataFrame. By default, as many rows as fit in the maximum number
+            of bound parameters.
 
         Raises
         -------
@@ -378,45 +608,55 @@ class AlchemyClient(SQLClient):
                 'yet implemented'
             )
 
-        params = {}
-        if self.has_attachment:
-            # for database with attachment
-            # see: https://github.com/ibis-project/ibis/issues/1930
-            params['schema'] = self.database_name
-
         if isinstance(obj, pd.DataFrame):
-            obj.to_sql(
-                table_name,
-                self.con,
-                index=False,
-                if_exists='replace' if overwrite else 'append',
-                **params,
+            self._insert_from_dataframe(
+                table_name, obj, overwrite=overwrite, chunksize=chunksize
             )
         elif isinstance(obj, ir.TableExpr):
-            to_table_expr = self.table(table_name)
-            to_table_schema = to_table_expr.schema()
-
-            if overwrite:
-                self.drop_table(table_name, database=database)
-                self.create_table(
-                    table_name, schema=to_table_schema, database=database,
-                )
-
-            to_table = self._get_sqla_table(table_name, schema=database)
-
-            from_table_expr = obj
-
-            with self.begin() as bind:
-                if from_table_expr is not None:
-                    bind.execute(
-                        to_table.insert().from_select(
-                            list(from_table_expr.columns),
-                            from_table_expr.compile(),
-                        )
-                    )
+            self._insert_from_table(
+                table_name, obj, database=database, overwrite=overwrite
+            )
         else:
             raise ValueError(
                 "No operation is being performed. Either the obj parameter "
                 "is not a pandas DataFrame or is not a ibis TableExpr."
                 f"The given obj is of type {type(obj).__name__} ."
             )
+
+    def _insert_from_dataframe(
+        self,
+        table_name: str,
+        data: pd.DataFrame,
+        overwrite: bool = False,
+        chunksize: Optional[int] = None,
+    ) -> None:
+        self._write_dataframe(
+            table_name,
+            data,
+            if_exists='replace' if overwrite else 'append',
+            chunksize=chunksize,
+        )
+
+    def _insert_from_table(
+        self,
+        table_name: str,
+        expr: ir.TableExpr,
+        database: Optional[str] = None,
+        overwrite: bool = False,
+    ) -> None:
+        if overwrite:
+            to_table_schema = self.table(table_name).schema()
+            self.drop_table(table_name, database=database)
+            self.create_table(
+                table_name, schema=to_table_schema, database=database,
+            )
+
+        to_table = self._get_sqla_table(table_name, schema=database)
+
+        # compile before opening the transaction, to keep it short
+        insert = to_table.insert().from_select(
+            list(expr.columns), self._compiled_for(expr)
+        )
+
+        with self.begin() as bind:
+            bind.execute(insert)
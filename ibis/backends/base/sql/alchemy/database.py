@@ -64,9 +64,12 @@ class AlchemyDatabase(Database):
     def table(self, name, schema=None):
         return self.client.table(name, schema=schema)
 
-    def list_tables(self, like=None, schema=None):
+    def list_tables(self, like=None, schema=None, kind='both'):
         return self.client.list_tables(
-            schema=schema, like=self._qualify_like(like), database=self.name
+            schema=schema,
+            like=self._qualify_like(like),
+            database=self.name,
+            kind=kind,
         )
 
     def schema(self, name):
@@ -1,3 +1,4 @@
+import functools
 from typing import Optional
 
 import sqlalchemy as sa
@@ -47,8 +48,19 @@ ibis_type_to_sqla = {
 
 
 def to_sqla_type(itype, type_map=None):
-    if type_map is None:
-        type_map = ibis_type_to_sqla
+    if type_map is None or type_map is ibis_type_to_sqla:
+        return _default_sqla_type(itype)
+    return _to_sqla_type(itype, type_map)
+
+
+@functools.lru_cache(maxsize=1024)
+def _default_sqla_type(itype):
+    # ibis types are immutable and hashable, so the conversion with the
+    # default type map can be reused across columns, tables and schemas
+    return _to_sqla_type(itype, ibis_type_to_sqla)
+
+
+def _to_sqla_type(itype, type_map):
     if isinstance(itype, dt.Decimal):
         return sa.types.NUMERIC(itype.precision, itype.scale)
     elif isinstance(itype, dt.Date):
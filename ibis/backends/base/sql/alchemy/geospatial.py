@@ -1,8 +1,13 @@
+import importlib.util
+
 try:
     import geoalchemy2  # noqa F401
-    import geoalchemy2.shape  # noqa F401
-    import geopandas  # noqa F401
 except ImportError:
     geospatial_supported = False
 else:
-    geospatial_supported = True
+    # shapely and geopandas are only needed to convert query results and are
+    # slow to import, so only check that they are installed here
+    geospatial_supported = all(
+        importlib.util.find_spec(name) is not None
+        for name in ('shapely', 'geopandas')
+    )
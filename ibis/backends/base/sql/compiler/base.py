@@ -70,17 +70,15 @@ class SetOp(DML):
         subqueries = self.subqueries
 
         return ',\n'.join(
-            '{} AS (\n{}\n)'.format(
-                context.get_ref(expr),
-                util.indent(context.get_compiled_expr(expr), 2),
-            )
+            f'{context.get_ref(expr)} AS (\n'
+            f'{util.indent(context.get_compiled_expr(expr), 2)}\n)'
             for expr in subqueries
         )
 
     def format_relation(self, expr):
         ref = self.context.get_ref(expr)
         if ref is not None:
-            return 'SELECT *\nFROM {}'.format(ref)
+            return f'SELECT *\nFROM {ref}'
         return self.context.get_compiled_expr(expr)
 
     def _get_keyword_list(self):
@@ -94,7 +92,7 @@ class SetOp(DML):
         buf = []
 
         if extracted:
-            buf.append('WITH {}'.format(extracted))
+            buf.append(f'WITH {extracted}')
 
         buf.extend(
             toolz.interleave(
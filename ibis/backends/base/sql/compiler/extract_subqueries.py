@@ -1,10 +1,29 @@
 from collections import OrderedDict
 
 import ibis.expr.operations as ops
-import ibis.expr.types as ir
 
 
 class ExtractSubqueries:
+    # map operation class names to the ``visit_<name>`` methods handling
+    # them; filled in for every subclass by ``__init_subclass__``
+    _visit_dispatch = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._make_dispatch_table()
+
+    @classmethod
+    def _make_dispatch_table(cls):
+        # operation names are capitalized, which leaves out the generic
+        # visit_join and visit_physical_table handlers
+        dispatch = {}
+        for name in dir(cls):
+            if name.startswith('visit_'):
+                op_name = name[len('visit_') :]
+                if op_name[:1].isupper():
+                    dispatch[op_name] = getattr(cls, name)
+        cls._visit_dispatch = dispatch
+
     def __init__(self, query, greedy=False):
         self.query = query
         self.greedy = greedy
@@ -36,30 +55,26 @@ class ExtractSubqueries:
     def observe(self, expr):
         key = expr.op()
 
-        if key not in self.node_to_expr:
-            self.node_to_expr[key] = expr
-
-        assert self.node_to_expr[key].equals(expr)
-        self.expr_counts[key] = self.expr_counts.setdefault(key, 0) + 1
+        # the first expression seen for an operation stands in for the
+        # equal ones seen later; finding the key already compared them
+        self.node_to_expr.setdefault(key, expr)
+        self.expr_counts[key] = self.expr_counts.get(key, 0) + 1
 
     def seen(self, expr):
         return expr.op() in self.expr_counts
 
     def visit(self, expr):
         node = expr.op()
-        method = 'visit_{}'.format(type(node).__name__)
+        visit = self._visit_dispatch.get(type(node).__name__)
 
-        if hasattr(self, method):
-            f = getattr(self, method)
-            f(expr)
+        if visit is not None:
+            visit(self, expr)
         elif isinstance(node, ops.Join):
             self.visit_join(expr)
         elif isinstance(node, ops.PhysicalTable):
             self.visit_physical_table(expr)
         elif isinstance(node, ops.ValueOp):
-            for arg in node.flat_args():
-                if not isinstance(arg, ir.Expr):
-                    continue
+            for arg in node.flat_expr_args():
                 self.visit(arg)
         else:
             raise NotImplementedError(type(node))
@@ -127,3 +142,6 @@ class ExtractSubqueries:
 
     def visit_SelfReference(self, expr):
         self.visit(expr.op().table)
+
+
+ExtractSubqueries._make_dispatch_table()
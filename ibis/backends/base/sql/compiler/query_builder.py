@@ -1,3 +1,4 @@
+import functools
 from io import StringIO
 
 import toolz
@@ -14,6 +15,69 @@ from .base import DML, QueryAST, SetOp
 from .extract_subqueries import ExtractSubqueries
 
 
+@functools.lru_cache(maxsize=None)
+def _filter_rewrite_kind(cls):
+    # how SelectBuilder rewrites a WHERE predicate only depends on the type
+    # of its operation, so resolve the isinstance checks once per type
+    if issubclass(cls, ops.BinaryOp):
+        return 'binary'
+    elif issubclass(
+        cls, (ops.Any, ops.BooleanValueOp, ops.TableColumn, ops.Literal)
+    ):
+        return 'leaf'
+    elif issubclass(cls, ops.ValueOp):
+        return 'value'
+    else:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _group_by_positions(n):
+    # GROUP BY refers to the first n columns of the select list by position;
+    # the tuple is shared, which is fine since it is never mutated
+    return tuple(range(n))
+
+
+def _null_propagating_tables(expr):
+    """Return the operations of the tables whose columns make `expr` NULL
+    when they are NULL.
+    """
+    op = expr.op()
+    if isinstance(op, ops.TableColumn):
+        return frozenset([op.table.op()])
+    elif isinstance(op, ops.NumericBinaryOp):
+        return _null_propagating_tables(op.left) | _null_propagating_tables(
+            op.right
+        )
+    elif isinstance(op, (ops.Negate, ops.Cast)):
+        return _null_propagating_tables(op.arg)
+    else:
+        return frozenset()
+
+
+def _null_rejecting_tables(predicate):
+    """Return the operations of the tables for which `predicate` can't be
+    true on a row whose columns from that table are all NULL.
+    """
+    op = predicate.op()
+    if isinstance(op, ops.And):
+        return _null_rejecting_tables(op.left) | _null_rejecting_tables(
+            op.right
+        )
+    elif isinstance(op, ops.Comparison) and not isinstance(
+        op, ops.IdenticalTo
+    ):
+        return _null_propagating_tables(op.left) | _null_propagating_tables(
+            op.right
+        )
+    elif isinstance(op, ops.Between):
+        return _null_propagating_tables(op.arg)
+    elif isinstance(op, ops.Contains):
+        return _null_propagating_tables(op.value)
+    else:
+        return frozenset()
+
+
 class _AnyToExistsTransform:
 
     """
@@ -21,11 +85,13 @@ class _AnyToExistsTransform:
     better code reuse.
     """
 
-    def __init__(self, context, expr, parent_table):
+    def __init__(self, context, expr, parent_table, query_roots=None):
         self.context = context
         self.expr = expr
         self.parent_table = parent_table
-        self.query_roots = frozenset(self.parent_table._root_tables())
+        if query_roots is None:
+            query_roots = frozenset(self.parent_table._root_tables())
+        self.query_roots = query_roots
 
     def get_result(self):
         self.foreign_table = None
@@ -42,31 +108,39 @@ class _AnyToExistsTransform:
         return expr_type(op)
 
     def _visit(self, expr):
-        node = expr.op()
-
-        for arg in node.flat_args():
-            if isinstance(arg, ir.TableExpr):
+        # walk the arguments depth first with an explicit stack, in the same
+        # order as the equivalent recursion; predicates are flagged so they
+        # are recorded when they are reached
+        stack = [(arg, False) for arg in reversed(expr.op().flat_expr_args())]
+        while stack:
+            arg, is_predicate = stack.pop()
+            if is_predicate:
+                self.predicates.append(arg)
+            elif isinstance(arg, ir.TableExpr):
                 self._visit_table(arg)
+                continue
             elif isinstance(arg, ir.BooleanColumn):
-                for sub_expr in L.flatten_predicate(arg):
-                    self.predicates.append(sub_expr)
-                    self._visit(sub_expr)
-            elif isinstance(arg, ir.Expr):
-                self._visit(arg)
-            else:
+                stack.extend(
+                    (sub_expr, True)
+                    for sub_expr in reversed(L.flatten_predicate(arg))
+                )
                 continue
 
+            stack.extend(
+                (sub_arg, False)
+                for sub_arg in reversed(arg.op().flat_expr_args())
+            )
+
     def _find_blocking_table(self, expr):
-        node = expr.op()
+        stack = [expr]
+        while stack:
+            expr = stack.pop()
+            node = expr.op()
 
-        if node.blocks():
-            return expr
+            if node.blocks():
+                return expr
 
-        for arg in node.flat_args():
-            if isinstance(arg, ir.Expr):
-                result = self._find_blocking_table(arg)
-                if result is not None:
-                    return result
+            stack.extend(reversed(node.flat_expr_args()))
 
     def _visit_table(self, expr):
         node = expr.op()
@@ -82,9 +156,8 @@ class _AnyToExistsTransform:
                     self.foreign_table = expr
         else:
             if not node.blocks():
-                for arg in node.flat_args():
-                    if isinstance(arg, ir.Expr):
-                        self._visit(arg)
+                for arg in node.flat_expr_args():
+                    self._visit(arg)
 
     def _is_root(self, what):
         if isinstance(what, ir.Expr):
@@ -93,11 +166,14 @@ class _AnyToExistsTransform:
 
 
 class _CorrelatedRefCheck:
-    def __init__(self, query, expr):
+    def __init__(self, query, expr, query_roots=None):
         self.query = query
         self.ctx = query.context
         self.expr = expr
-        self.query_roots = frozenset(self.query.table_set._root_tables())
+        if query_roots is None:
+            query_roots = frozenset(self.query.table_set._root_tables())
+        self.query_roots = query_roots
+        self._is_root_cache = {}
 
         # aliasing required
         self.foreign_refs = []
@@ -109,36 +185,36 @@ class _CorrelatedRefCheck:
         self.visit(self.expr)
         return self.has_query_root and self.has_foreign_root
 
-    def visit(
-        self, expr, in_subquery=False, visit_cache=None, visit_table_cache=None
-    ):
-        if visit_cache is None:
-            visit_cache = set()
+    def visit(self, expr, in_subquery=False):
+        visit_cache = set()
+        visit_table_cache = {}
 
+        # walk the expression depth first with an explicit stack, in the same
+        # order as the equivalent recursion so that tables are aliased in the
+        # same order
+        stack = [(expr, in_subquery, False)]
+        while stack:
+            expr, in_subquery, is_table = stack.pop()
+            if is_table:
+                args = self.visit_table(expr, in_subquery, visit_table_cache)
+            else:
+                args = self._visit_value(expr, in_subquery, visit_cache)
+            stack.extend(reversed(args))
+
+    def _visit_value(self, expr, in_subquery, visit_cache):
         node = expr.op()
         key = node, in_subquery
         if key in visit_cache:
-            return
+            return ()
 
         visit_cache.add(key)
 
         in_subquery = in_subquery or self.is_subquery(node)
 
-        for arg in node.flat_args():
-            if isinstance(arg, ir.TableExpr):
-                self.visit_table(
-                    arg,
-                    in_subquery=in_subquery,
-                    visit_cache=visit_cache,
-                    visit_table_cache=visit_table_cache,
-                )
-            elif isinstance(arg, ir.Expr):
-                self.visit(
-                    arg,
-                    in_subquery=in_subquery,
-                    visit_cache=visit_cache,
-                    visit_table_cache=visit_table_cache,
-                )
+        return [
+            (arg, in_subquery, isinstance(arg, ir.TableExpr))
+            for arg in node.flat_expr_args()
+        ]
 
     def is_subquery(self, node):
         # XXX
@@ -153,30 +229,20 @@ class _CorrelatedRefCheck:
 
         return False
 
-    def visit_table(
-        self, expr, in_subquery=False, visit_cache=None, visit_table_cache=None
-    ):
-        if visit_table_cache is None:
-            visit_table_cache = set()
-
-        key = expr._key, in_subquery
-        if key in visit_table_cache:
-            return
-        visit_table_cache.add(key)
-
+    def visit_table(self, expr, in_subquery, visit_table_cache):
+        # tables are looked up by identity instead of by their (structurally
+        # compared) key, keeping the node alive so its id can't be reused
         node = expr.op()
+        key = id(node), in_subquery
+        if key in visit_table_cache:
+            return ()
+        visit_table_cache[key] = node
 
         if isinstance(node, (ops.PhysicalTable, ops.SelfReference)):
             self.ref_check(node, in_subquery=in_subquery)
 
-        for arg in node.flat_args():
-            if isinstance(arg, ir.Expr):
-                self.visit(
-                    arg,
-                    in_subquery=in_subquery,
-                    visit_cache=visit_cache,
-                    visit_table_cache=visit_table_cache,
-                )
+        # the arguments of a table are visited as values, even tables
+        return [(arg, in_subquery, False) for arg in node.flat_expr_args()]
 
     def ref_check(self, node, in_subquery=False):
         ctx = self.ctx
@@ -196,7 +262,16 @@ class _CorrelatedRefCheck:
     def is_root(self, what):
         if isinstance(what, ir.Expr):
             what = what.op()
-        return what in self.query_roots
+
+        # the membership test compares table nodes structurally, so remember
+        # the answer for each node that was already checked
+        key = id(what)
+        try:
+            return self._is_root_cache[key][1]
+        except KeyError:
+            result = what in self.query_roots
+            self._is_root_cache[key] = what, result
+            return result
 
 
 class TableSetFormatter:
@@ -228,7 +303,7 @@ class TableSetFormatter:
         left = op.left.op()
         right = op.right.op()
 
-        if util.all_of([left, right], ops.Join):
+        if isinstance(left, ops.Join) and isinstance(right, ops.Join):
             raise NotImplementedError(
                 'Do not support joins between ' 'joins yet'
             )
@@ -278,8 +353,7 @@ class TableSetFormatter:
     def _get_join_type(self, op):
         return self._join_names[type(op)]
 
-    def _quote_identifier(self, name):
-        return quote_identifier(name)
+    _quote_identifier = staticmethod(quote_identifier)
 
     def _format_table(self, expr):
         # TODO: This could probably go in a class and be significantly nicer
@@ -308,16 +382,16 @@ class TableSetFormatter:
 
                 # HACK: self-references have to be treated more carefully here
                 if isinstance(op, ops.SelfReference):
-                    return '{} {}'.format(ctx.get_ref(ref_expr), alias)
+                    return f'{ctx.get_ref(ref_expr)} {alias}'
                 else:
                     return alias
 
             subquery = ctx.get_compiled_expr(expr)
-            result = '(\n{}\n)'.format(util.indent(subquery, self.indent))
+            result = f'(\n{util.indent(subquery, self.indent)}\n)'
             is_subquery = True
 
         if is_subquery or ctx.need_aliases(expr):
-            result += ' {}'.format(ctx.get_ref(expr))
+            result += f' {ctx.get_ref(expr)}'
 
         return result
 
@@ -333,32 +407,27 @@ class TableSetFormatter:
             self.join_tables.append(self._format_table(self.expr))
 
         # TODO: Now actually format the things
-        buf = StringIO()
-        buf.write(self.join_tables[0])
+        conj = ' AND\n   '
+        parts = [self.join_tables[0]]
         for jtype, table, preds in zip(
             self.join_types, self.join_tables[1:], self.join_predicates
         ):
-            buf.write('\n')
-            buf.write(util.indent('{} {}'.format(jtype, table), self.indent))
-
-            fmt_preds = []
-            npreds = len(preds)
-            for pred in preds:
-                new_pred = self._translate(pred)
-                if npreds > 1:
-                    new_pred = '({})'.format(new_pred)
-                fmt_preds.append(new_pred)
-
-            if len(fmt_preds):
-                buf.write('\n')
-
-                conj = ' AND\n{}'.format(' ' * 3)
-                fmt_preds = util.indent(
-                    'ON ' + conj.join(fmt_preds), self.indent * 2
+            parts.append('\n')
+            parts.append(util.indent(f'{jtype} {table}', self.indent))
+
+            fmt_preds = [self._translate(pred) for pred in preds]
+            if len(fmt_preds) > 1:
+                fmt_preds = [f'({pred})' for pred in fmt_preds]
+
+            if fmt_preds:
+                parts.append('\n')
+
+                # the ON clause is indented as a whole, in a single pass
+                parts.append(
+                    util.indent('ON ' + conj.join(fmt_preds), self.indent * 2)
                 )
-                buf.write(fmt_preds)
 
-        return buf.getvalue()
+        return ''.join(parts)
 
 
 class Select(DML):
@@ -407,14 +476,24 @@ class Select(DML):
 
         self.result_handler = result_handler
 
+        self._translator_class = None
+
     @property
     def translator(self):
         return self.context.dialect.translator
 
     def _translate(self, expr, named=False, permit_subquery=False):
-        context = self.context
-        translator = self.translator(
-            expr, context=context, named=named, permit_subquery=permit_subquery
+        # resolve the translator class once per query; subclasses may still
+        # override the ``translator`` property
+        translator_class = self._translator_class
+        if translator_class is None:
+            translator_class = self._translator_class = self.translator
+
+        translator = translator_class(
+            expr,
+            context=self.context,
+            named=named,
+            permit_subquery=permit_subquery,
         )
         return translator.get_result()
 
@@ -427,33 +506,34 @@ class Select(DML):
         try:
             return cache[key]
         except KeyError:
-            cache[key] = result = self is other or (
-                isinstance(other, Select)
-                and self.limit == other.limit
-                and ops.all_equal(self._all_exprs(), other._all_exprs())
+            pass
+
+        if self is other:
+            result = True
+        elif not isinstance(other, Select) or self.limit != other.limit:
+            result = False
+        else:
+            exprs, other_exprs = self._all_exprs(), other._all_exprs()
+            # expressions cache the hashes of their operations, so comparing
+            # hashes first rules out most unequal queries without walking
+            # both expression trees
+            result = hash(exprs) == hash(other_exprs) and ops.all_equal(
+                exprs, other_exprs, cache=cache
             )
-            return result
+
+        cache[key] = result
+        return result
 
     def _all_exprs(self):
-        # Gnarly, maybe we can improve this somehow
-        expr_attrs = (
-            'select_set',
-            'table_set',
-            'where',
-            'group_by',
-            'having',
-            'order_by',
-            'subqueries',
+        return (
+            *self.select_set,
+            self.table_set,
+            *self.where,
+            *self.group_by,
+            *self.having,
+            *self.order_by,
+            *self.subqueries,
         )
-        exprs = []
-        for attr in expr_attrs:
-            val = getattr(self, attr)
-            if isinstance(val, list):
-                exprs.extend(val)
-            else:
-                exprs.append(val)
-
-        return exprs
 
     def compile(self):
         """
@@ -513,9 +593,9 @@ class Select(DML):
         for i, expr in enumerate(self.subqueries):
             formatted = util.indent(context.get_compiled_expr(expr), 2)
             alias = context.get_ref(expr)
-            buf.append('{} AS (\n{}\n)'.format(alias, formatted))
+            buf.append(f'{alias} AS (\n{formatted}\n)')
 
-        return 'WITH {}'.format(',\n'.join(buf))
+        return 'WITH ' + ',\n'.join(buf)
 
     def format_select_set(self):
         # TODO:
@@ -530,26 +610,26 @@ class Select(DML):
                     alias = context.get_ref(expr)
 
                     # materialized join will not have an alias. see #491
-                    expr_str = '{}.*'.format(alias) if alias else '*'
+                    expr_str = f'{alias}.*' if alias else '*'
                 else:
                     expr_str = '*'
             formatted.append(expr_str)
 
-        buf = StringIO()
+        parts = []
         line_length = 0
         max_length = 70
         tokens = 0
         for i, val in enumerate(formatted):
             # always line-break for multi-line expressions
-            if val.count('\n'):
+            if '\n' in val:
                 if i:
-                    buf.write(',')
-                buf.write('\n')
+                    parts.append(',')
+                parts.append('\n')
                 indented = util.indent(val, self.indent)
-                buf.write(indented)
+                parts.append(indented)
 
                 # set length of last line
-                line_length = len(indented.split('\n')[-1])
+                line_length = len(indented) - indented.rfind('\n') - 1
                 tokens = 1
             elif (
                 tokens > 0
@@ -558,15 +638,15 @@ class Select(DML):
             ):
                 # There is an expr, and adding this new one will make the line
                 # too long
-                buf.write(',\n       ') if i else buf.write('\n')
-                buf.write(val)
+                parts.append(',\n       ' if i else '\n')
+                parts.append(val)
                 line_length = len(val) + 7
                 tokens = 1
             else:
                 if i:
-                    buf.write(',')
-                buf.write(' ')
-                buf.write(val)
+                    parts.append(',')
+                parts.append(' ')
+                parts.append(val)
                 tokens += 1
                 line_length += len(val) + 2
 
@@ -575,7 +655,7 @@ class Select(DML):
         else:
             select_key = 'SELECT'
 
-        return '{}{}'.format(select_key, buf.getvalue())
+        return select_key + ''.join(parts)
 
     @property
     def table_set_formatter(self):
@@ -593,23 +673,15 @@ class Select(DML):
         return fragment
 
     def format_group_by(self):
-        if not len(self.group_by):
+        if not self.group_by:
             # There is no aggregation, nothing to see here
             return None
 
-        lines = []
-        if len(self.group_by) > 0:
-            clause = 'GROUP BY {}'.format(
-                ', '.join([str(x + 1) for x in self.group_by])
-            )
-            lines.append(clause)
+        lines = ['GROUP BY ' + ', '.join(str(x + 1) for x in self.group_by)]
 
-        if len(self.having) > 0:
-            trans_exprs = []
-            for expr in self.having:
-                translated = self._translate(expr)
-                trans_exprs.append(translated)
-            lines.append('HAVING {}'.format(' AND '.join(trans_exprs)))
+        if self.having:
+            trans_exprs = map(self._translate, self.having)
+            lines.append('HAVING ' + ' AND '.join(trans_exprs))
 
         return '\n'.join(lines)
 
@@ -617,19 +689,13 @@ class Select(DML):
         if not self.where:
             return None
 
-        buf = StringIO()
-        buf.write('WHERE ')
-        fmt_preds = []
-        npreds = len(self.where)
-        for pred in self.where:
-            new_pred = self._translate(pred, permit_subquery=True)
-            if npreds > 1:
-                new_pred = '({})'.format(new_pred)
-            fmt_preds.append(new_pred)
-
-        conj = ' AND\n{}'.format(' ' * 6)
-        buf.write(conj.join(fmt_preds))
-        return buf.getvalue()
+        fmt_preds = [
+            self._translate(pred, permit_subquery=True) for pred in self.where
+        ]
+        if len(fmt_preds) > 1:
+            fmt_preds = [f'({pred})' for pred in fmt_preds]
+
+        return 'WHERE ' + ' AND\n      '.join(fmt_preds)
 
     def format_order_by(self):
         if not self.order_by:
@@ -656,9 +722,9 @@ class Select(DML):
         buf = StringIO()
 
         n, offset = self.limit['n'], self.limit['offset']
-        buf.write('LIMIT {}'.format(n))
+        buf.write(f'LIMIT {n}')
         if offset is not None and offset != 0:
-            buf.write(' OFFSET {}'.format(offset))
+            buf.write(f' OFFSET {offset}')
 
         return buf.getvalue()
 
@@ -677,6 +743,53 @@ class SelectBuilder:
 
     _select_class = Select
 
+    # the join type an outer join reduces to once the NULL-extended rows of
+    # its (left, right) side are known to be filtered out
+    _outer_join_reductions = {
+        ops.LeftJoin: {
+            (False, True): ops.InnerJoin,
+            (True, True): ops.InnerJoin,
+        },
+        ops.RightJoin: {
+            (True, False): ops.InnerJoin,
+            (True, True): ops.InnerJoin,
+        },
+        ops.OuterJoin: {
+            (True, False): ops.LeftJoin,
+            (False, True): ops.RightJoin,
+            (True, True): ops.InnerJoin,
+        },
+    }
+
+    # map operation class names to the ``_visit_select_<name>``,
+    # ``_visit_filter_<name>`` and ``_collect_<name>`` methods handling them;
+    # filled in for every subclass by ``__init_subclass__``
+    _visit_select_dispatch = {}
+    _visit_filter_dispatch = {}
+    _collect_dispatch = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._make_dispatch_tables()
+
+    @classmethod
+    def _make_dispatch_tables(cls):
+        cls._visit_select_dispatch = cls._make_dispatch('_visit_select_')
+        cls._visit_filter_dispatch = cls._make_dispatch('_visit_filter_')
+        cls._collect_dispatch = cls._make_dispatch('_collect_')
+
+    @classmethod
+    def _make_dispatch(cls, prefix):
+        # operation names are capitalized, which leaves out helpers sharing
+        # the prefix such as _collect_elements or the tables themselves
+        dispatch = {}
+        for name in dir(cls):
+            if name.startswith(prefix):
+                op_name = name[len(prefix) :]
+                if op_name[:1].isupper():
+                    dispatch[op_name] = getattr(cls, name)
+        return dispatch
+
     def __init__(self, expr, context):
         self.expr = expr
 
@@ -698,6 +811,11 @@ class SelectBuilder:
         self.distinct = False
 
         self.op_memo = set()
+        self.select_expr_memo = {}
+        self.filter_expr_memo = {}
+        self.blocking_base_memo = {}
+        self.rank_set_memo = {}
+        self._query_roots_memo = None
 
     def get_result(self):
         # make idempotent
@@ -711,10 +829,24 @@ class SelectBuilder:
         return select_query
 
     @staticmethod
-    def _foreign_ref_check(query, expr):
-        checker = _CorrelatedRefCheck(query, expr)
+    def _foreign_ref_check(query, expr, query_roots=None):
+        checker = _CorrelatedRefCheck(query, expr, query_roots=query_roots)
         return checker.get_result()
 
+    def _query_roots(self):
+        # the root tables of the table set are needed for every filter that
+        # is checked for correlated references, so only collect them again
+        # when the table set changes
+        table_set = self.table_set
+        if self._query_roots_memo is None or (
+            self._query_roots_memo[0] is not table_set
+        ):
+            self._query_roots_memo = (
+                table_set,
+                frozenset(table_set._root_tables()),
+            )
+        return self._query_roots_memo[1]
+
     @staticmethod
     def _adapt_expr(expr):
         # Non-table expressions need to be adapted to some well-formed table
@@ -816,40 +948,72 @@ class SelectBuilder:
             )
 
     @staticmethod
-    def _get_subtables(expr):
-        subtables = []
+    def _join_leaves(expr, seen=None):
+        """Yield the tables joined by `expr` from left to right, or `expr`
+        itself if it isn't a join.
 
+        If `seen` is a set, operations already in it are skipped, and the
+        visited operations are added to it.
+        """
         stack = [expr]
-        seen = set()
-
         while stack:
             e = stack.pop()
             op = e.op()
 
-            if op not in seen:
+            if seen is not None:
+                if op in seen:
+                    continue
                 seen.add(op)
 
-                if isinstance(op, ops.Join):
-                    stack.append(op.right)
-                    stack.append(op.left)
-                else:
-                    subtables.append(e)
+            if isinstance(op, ops.Join):
+                stack.append(op.right)
+                stack.append(op.left)
+            else:
+                yield e
 
-        return subtables
+    @classmethod
+    def _get_subtables(cls, expr):
+        return list(cls._join_leaves(expr, seen=set()))
 
     def _blocking_base(self, expr):
-        node = expr.op()
-        if node.blocks() or isinstance(node, ops.Join):
-            return expr
-        else:
-            for arg in expr.op().flat_args():
-                if isinstance(arg, ir.TableExpr):
-                    return self._blocking_base(arg)
+        # the same tables are checked each time a join containing them is
+        # collected; the table is kept alive so its id can't be reused
+        key = id(expr.op())
+        try:
+            return self.blocking_base_memo[key][1]
+        except KeyError:
+            pass
+
+        result = self._find_blocking_base(expr)
+        self.blocking_base_memo[key] = expr, result
+        return result
+
+    @staticmethod
+    def _find_blocking_base(expr):
+        # follow the first table argument down until a blocking node or a
+        # join is reached
+        while expr is not None:
+            node = expr.op()
+            if node.blocks() or isinstance(node, ops.Join):
+                return expr
+            expr = next(
+                (
+                    arg
+                    for arg in node.flat_expr_args()
+                    if isinstance(arg, ir.TableExpr)
+                ),
+                None,
+            )
+        return None
 
     def _all_distinct_roots(self, subtables):
-        bases = []
+        # bucket the bases by the hash of their operation, so that only bases
+        # that may be equal are compared structurally
+        buckets = {}
         for t in subtables:
             base = self._blocking_base(t)
+            key = hash(base.op()) if base is not None else None
+            bases = buckets.setdefault(key, [])
             for x in bases:
                 if base.equals(x):
                     return False
@@ -899,26 +1063,23 @@ class SelectBuilder:
         # going to see if any table nodes appearing in the where stack have
         # been marked previously by the above code.
         for expr in self.filters:
-            needs_alias = self._foreign_ref_check(self, expr)
+            needs_alias = self._foreign_ref_check(
+                self, expr, query_roots=self._query_roots()
+            )
             if needs_alias:
                 self.context.set_always_alias()
 
     def _make_table_aliases(self, expr):
         ctx = self.context
-        node = expr.op()
-        if isinstance(node, ops.Join):
-            for arg in node.args:
-                if isinstance(arg, ir.TableExpr):
-                    self._make_table_aliases(arg)
-        else:
-            if not ctx.is_extracted(expr):
-                ctx.make_alias(expr)
+        for table in self._join_leaves(expr):
+            if not ctx.is_extracted(table):
+                ctx.make_alias(table)
             else:
                 # The compiler will apply a prefix only if the current context
                 # contains two or more table references. So, if we've extracted
                 # a subquery into a CTE, we need to propagate that reference
                 # down to child contexts so that they aren't missing any refs.
-                ctx.set_ref(expr, ctx.top_context.get_ref(expr))
+                ctx.set_ref(table, ctx.top_context.get_ref(table))
 
     # ---------------------------------------------------------------------
     # Expr analysis / rewrites
@@ -933,32 +1094,42 @@ class SelectBuilder:
         self.select_set = new_select_set
 
     def _visit_select_expr(self, expr):
+        # subexpressions shared by several select expressions are rewritten
+        # once. The memo keeps the visited expression alive, so its id can't
+        # be reused by another expression while the builder is in use
+        key = id(expr)
+        try:
+            return self.select_expr_memo[key][1]
+        except KeyError:
+            pass
+
+        result = self._rewrite_select_expr(expr)
+        self.select_expr_memo[key] = expr, result
+        return result
+
+    def _rewrite_select_expr(self, expr):
         op = expr.op()
 
-        method = '_visit_select_{0}'.format(type(op).__name__)
-        if hasattr(self, method):
-            f = getattr(self, method)
-            return f(expr)
+        visit = self._visit_select_dispatch.get(type(op).__name__)
+        if visit is not None:
+            return visit(self, expr)
 
-        unchanged = True
+        if not isinstance(op, ops.ValueOp):
+            return expr
 
-        if isinstance(op, ops.ValueOp):
-            new_args = []
-            for arg in op.args:
-                if isinstance(arg, ir.Expr):
-                    new_arg = self._visit_select_expr(arg)
-                    if arg is not new_arg:
-                        unchanged = False
-                    new_args.append(new_arg)
-                else:
-                    new_args.append(arg)
+        # only copy the arguments once one of them was actually rewritten
+        new_args = None
+        for i, arg in enumerate(op.args):
+            if isinstance(arg, ir.Expr):
+                new_arg = self._visit_select_expr(arg)
+                if new_arg is not arg:
+                    if new_args is None:
+                        new_args = list(op.args)
+                    new_args[i] = new_arg
 
-            if not unchanged:
-                return expr._factory(type(op)(*new_args))
-            else:
-                return expr
-        else:
+        if new_args is None:
             return expr
+        return expr._factory(type(op)(*new_args))
 
     def _visit_select_Histogram(self, expr):
         op = expr.op()
@@ -998,6 +1169,7 @@ class SelectBuilder:
         # Various kinds of semantically valid WHERE clauses may need to be
         # rewritten into a form that we can actually translate into valid SQL.
         new_where = []
+        changed = False
         for expr in self.filters:
             new_expr = self._visit_filter(expr)
 
@@ -1005,10 +1177,81 @@ class SelectBuilder:
             # predicate
             if new_expr is not None:
                 new_where.append(new_expr)
+            changed = changed or new_expr is not expr
+
+        if changed:
+            self.filters = new_where
+
+        self._eliminate_outer_joins()
+
+    def _eliminate_outer_joins(self):
+        # A WHERE predicate that can't be true when the columns of a table
+        # are NULL filters out the rows an outer join pads with NULLs for
+        # that table; the join can drop the outer side of that table
+        table_set = self.table_set
+        if table_set is None or not self._outer_join_reductions:
+            return
+
+        rejected = set()
+        for predicate in self.filters:
+            rejected.update(_null_rejecting_tables(predicate))
+        if not rejected:
+            return
+
+        new_table_set = self._reduce_outer_joins(table_set, rejected)
+        if new_table_set is not table_set:
+            self.table_set = new_table_set
+            self.select_set = [
+                new_table_set if expr is table_set else expr
+                for expr in self.select_set
+            ]
+
+    @classmethod
+    def _reduce_outer_joins(cls, expr, rejected):
+        op = expr.op()
+        if not isinstance(op, ops.Join):
+            return expr
+
+        left = cls._reduce_outer_joins(op.left, rejected)
+        right = cls._reduce_outer_joins(op.right, rejected)
+
+        join_type = type(op)
+        reductions = cls._outer_join_reductions.get(join_type)
+        if reductions is not None:
+            left_tables = {t.op() for t in cls._join_leaves(op.left)}
+            right_tables = {t.op() for t in cls._join_leaves(op.right)}
+            # a table joined on both sides is never NULL-extended as a whole
+            sides = (
+                not rejected.isdisjoint(left_tables - right_tables),
+                not rejected.isdisjoint(right_tables - left_tables),
+            )
+            join_type = reductions.get(sides, join_type)
+
+        if join_type is type(op) and left is op.left and right is op.right:
+            return expr
 
-        self.filters = new_where
+        # keep the arguments past the tables, e.g. the ones of an asof join;
+        # a cross join is built from its tables alone
+        args = (left, right) + tuple(op.args[2:])
+        if isinstance(op, ops.CrossJoin):
+            args = args[:2]
+        return join_type(*args).to_expr()
 
     def _visit_filter(self, expr):
+        # subexpressions shared by several predicates are rewritten once;
+        # like the select expression memo, the visited expression is kept
+        # alive so its id can't be reused
+        key = id(expr)
+        try:
+            return self.filter_expr_memo[key][1]
+        except KeyError:
+            pass
+
+        result = self._rewrite_filter_expr(expr)
+        self.filter_expr_memo[key] = expr, result
+        return result
+
+    def _rewrite_filter_expr(self, expr):
         # Dumping ground for analysis of WHERE expressions
         # - Subquery extraction
         # - Conversion to explicit semi/anti joins
@@ -1016,41 +1259,35 @@ class SelectBuilder:
 
         op = expr.op()
 
-        method = '_visit_filter_{0}'.format(type(op).__name__)
-        if hasattr(self, method):
-            f = getattr(self, method)
-            return f(expr)
+        visit = self._visit_filter_dispatch.get(type(op).__name__)
+        if visit is not None:
+            return visit(self, expr)
 
-        unchanged = True
         if isinstance(expr, ir.ScalarExpr):
             if L.is_reduction(expr):
                 return self._rewrite_reduction_filter(expr)
 
-        if isinstance(op, ops.BinaryOp):
+        kind = _filter_rewrite_kind(type(op))
+        if kind == 'binary':
             left = self._visit_filter(op.left)
             right = self._visit_filter(op.right)
-            unchanged = left is op.left and right is op.right
-            if not unchanged:
-                return expr._factory(type(op)(left, right))
-            else:
+            if left is op.left and right is op.right:
                 return expr
-        elif isinstance(
-            op, (ops.Any, ops.BooleanValueOp, ops.TableColumn, ops.Literal)
-        ):
+            return expr._factory(type(op)(left, right))
+        elif kind == 'leaf':
             return expr
-        elif isinstance(op, ops.ValueOp):
-            visited = [
-                self._visit_filter(arg) if isinstance(arg, ir.Expr) else arg
-                for arg in op.args
-            ]
+        elif kind == 'value':
             unchanged = True
-            for new, old in zip(visited, op.args):
-                if new is not old:
-                    unchanged = False
-            if not unchanged:
-                return expr._factory(type(op)(*visited))
-            else:
+            visited = []
+            for arg in op.args:
+                if isinstance(arg, ir.Expr):
+                    new_arg = self._visit_filter(arg)
+                    unchanged = unchanged and new_arg is arg
+                    arg = new_arg
+                visited.append(arg)
+            if unchanged:
                 return expr
+            return expr._factory(type(op)(*visited))
         else:
             raise NotImplementedError(type(op))
 
@@ -1066,7 +1303,12 @@ class SelectBuilder:
     def _visit_filter_Any(self, expr):
         # Rewrite semi/anti-join predicates in way that can hook into SQL
         # translation step
-        transform = _AnyToExistsTransform(self.context, expr, self.table_set)
+        transform = _AnyToExistsTransform(
+            self.context,
+            expr,
+            self.table_set,
+            query_roots=self._query_roots(),
+        )
         return transform.get_result()
 
     _visit_filter_NotAny = _visit_filter_Any
@@ -1081,9 +1323,17 @@ class SelectBuilder:
         summary_expr = parent_op.args[0]
         op = summary_expr.op()
 
-        rank_set = summary_expr.to_aggregation(
-            backup_metric_name='__tmp__', parent_table=self.table_set
-        )
+        # the same top K can appear in several predicates; its rank set is
+        # only built once, while the semi join below depends on the current
+        # table set
+        key = id(op)
+        try:
+            rank_set = self.rank_set_memo[key][1]
+        except KeyError:
+            rank_set = summary_expr.to_aggregation(
+                backup_metric_name='__tmp__', parent_table=self.table_set
+            )
+            self.rank_set_memo[key] = summary_expr, rank_set
 
         # GH 1393: previously because of GH667 we were substituting parents,
         # but that introduced a bug when comparing reductions to columns on the
@@ -1126,15 +1376,14 @@ class SelectBuilder:
 
     def _collect(self, expr, toplevel=False):
         op = expr.op()
-        method = '_collect_{0}'.format(type(op).__name__)
 
         # Do not visit nodes twice
         if op in self.op_memo:
             return
 
-        if hasattr(self, method):
-            f = getattr(self, method)
-            f(expr, toplevel=toplevel)
+        collect = self._collect_dispatch.get(type(op).__name__)
+        if collect is not None:
+            collect(self, expr, toplevel=toplevel)
         elif isinstance(op, (ops.PhysicalTable, ops.SQLQueryResult)):
             self._collect_PhysicalTable(expr, toplevel=toplevel)
         elif isinstance(op, ops.Join):
@@ -1230,7 +1479,7 @@ class SelectBuilder:
         self._collect_Join(join, toplevel=False)
 
     def _convert_group_by(self, exprs):
-        return list(range(len(exprs)))
+        return _group_by_positions(len(exprs))
 
     def _collect_Join(self, expr, toplevel=False):
         if toplevel:
@@ -1270,6 +1519,13 @@ class SelectBuilder:
     # --------------------------------------------------------------------
     # Subquery analysis / extraction
 
+    def _has_physical_table_set(self):
+        table_set = self.table_set
+        return table_set is None or all(
+            isinstance(table.op(), ops.PhysicalTable)
+            for table in self._join_leaves(table_set)
+        )
+
     def _analyze_subqueries(self):
         # Somewhat temporary place for this. A little bit tricky, because
         # subqueries can be found in many places
@@ -1291,6 +1547,12 @@ class SelectBuilder:
         # appear in the WITH part of the SELECT statement, if that's what you
         # want.
 
+        # Without filters, a table set made only of physical tables can't
+        # contain any subquery, so there is nothing to walk.
+        if not self.filters and self._has_physical_table_set():
+            self.subqueries = []
+            return
+
         # Find the subqueries, and record them in the passed query context.
         subqueries = ExtractSubqueries.extract(self)
         self.subqueries = []
@@ -1301,6 +1563,9 @@ class SelectBuilder:
                 self.context.set_extracted(expr)
 
 
+SelectBuilder._make_dispatch_tables()
+
+
 class Union(SetOp):
     def __init__(self, tables, expr, context, distincts):
         super().__init__(tables, expr, context)
@@ -1333,14 +1598,21 @@ def flatten_union(table: ir.TableExpr):
 
     Returns
     -------
-    Iterable[Union[TableExpr, bool]]
+    List[Union[TableExpr, bool]]
     """
-    op = table.op()
-    if isinstance(op, ops.Union):
-        return toolz.concatv(
-            flatten_union(op.left), [op.distinct], flatten_union(op.right)
-        )
-    return [table]
+    result = []
+    # walk the union tree left to right with an explicit stack; anything
+    # that isn't a table expression is a union's distinct flag
+    stack = [table]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, ir.TableExpr):
+            op = item.op()
+            if isinstance(op, ops.Union):
+                stack.extend((op.right, op.distinct, op.left))
+                continue
+        result.append(item)
+    return result
 
 
 def flatten_intersection(table: ir.TableExpr):
@@ -1352,16 +1624,22 @@ def flatten_intersection(table: ir.TableExpr):
 
     Returns
     -------
-    Iterable[Union[TableExpr]]
+    List[TableExpr]
     """
-    op = table.op()
-    if isinstance(op, ops.Intersection):
-        return toolz.concatv(flatten_union(op.left), flatten_union(op.right))
-    return [table]
+    result = []
+    stack = [table]
+    while stack:
+        item = stack.pop()
+        op = item.op()
+        if isinstance(op, ops.Intersection):
+            stack.extend((op.right, op.left))
+        else:
+            result.append(item)
+    return result
 
 
 def flatten_difference(table: ir.TableExpr):
-    """Extract all intersection queries from `table`.
+    """Extract all difference queries from `table`.
 
     Parameters
     ----------
@@ -1369,12 +1647,19 @@ def flatten_difference(table: ir.TableExpr):
 
     Returns
     -------
-    Iterable[Union[TableExpr]]
+    List[TableExpr]
     """
+    # EXCEPT associates to the left, so only the left operand of a
+    # difference can be merged into the same statement
+    tables = []
     op = table.op()
-    if isinstance(op, ops.Difference):
-        return toolz.concatv(flatten_union(op.left), flatten_union(op.right))
-    return [table]
+    while isinstance(op, ops.Difference):
+        tables.append(op.right)
+        table = op.left
+        op = table.op()
+    tables.append(table)
+    tables.reverse()
+    return tables
 
 
 class QueryBuilder:
@@ -1421,7 +1706,7 @@ class QueryBuilder:
 
     def _make_union(self):
         # flatten unions so that we can codegen them all at once
-        union_info = list(flatten_union(self.expr))
+        union_info = flatten_union(self.expr)
 
         # since op is a union, we have at least 3 elements in union_info (left
         # distinct right) and if there is more than a single union we have an
@@ -1441,14 +1726,14 @@ class QueryBuilder:
 
     def _make_intersect(self):
         # flatten intersections so that we can codegen them all at once
-        table_exprs = list(flatten_intersection(self.expr))
+        table_exprs = flatten_intersection(self.expr)
         return self.intersect_class(
             table_exprs, self.expr, context=self.context
         )
 
     def _make_difference(self):
         # flatten differences so that we can codegen them all at once
-        table_exprs = list(flatten_difference(self.expr))
+        table_exprs = flatten_difference(self.expr)
         return self.difference_class(
             table_exprs, self.expr, context=self.context
         )
@@ -34,7 +34,12 @@ class QueryContext:
 
         self.query = None
 
-        self._table_key_memo = {}
+        # a table's key only depends on the table, so the whole tree of
+        # contexts shares them instead of rendering them again in each
+        # subquery's context
+        self._table_key_memo = (
+            parent._table_key_memo if parent is not None else {}
+        )
         self.memo = memo or fmt.FormatMemo()
         self.dialect = dialect
         self.params = params if params is not None else {}
@@ -198,6 +203,10 @@ class ExprTranslator:
     _registry = operation_registry
     _rewrites = {}
 
+    # bumped whenever a rule is registered through `add_operation` or
+    # `rewrites`, so the backends can tell their compiled SQL is stale
+    _rules_version = 0
+
     context_class = QueryContext
 
     def __init__(self, expr, context, named=False, permit_subquery=False):
@@ -233,6 +242,7 @@ class ExprTranslator:
         added dynamically.
         """
         cls._registry[operation] = translate_function
+        ExprTranslator._rules_version += 1
 
     def _needs_name(self, expr):
         if not self.named:
@@ -286,6 +296,7 @@ class ExprTranslator:
     def rewrites(cls, klass):
         def decorator(f):
             cls._rewrites[klass] = f
+            ExprTranslator._rules_version += 1
             return f
 
         return decorator
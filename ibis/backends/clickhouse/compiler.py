@@ -22,6 +22,10 @@ def build_ast(expr, context):
 
 
 class ClickhouseSelectBuilder(SelectBuilder):
+    # outer joins fill unmatched columns with default values rather than
+    # NULLs, so filters on them don't make the joins inner
+    _outer_join_reductions = {}
+
     @property
     def _select_class(self):
         return ClickhouseSelect
@@ -145,8 +149,7 @@ class ClickhouseTableSetFormatter(TableSetFormatter):
         column = predicate.op().args[0]
         return quote_identifier(column.get_name(), force=True)
 
-    def _quote_identifier(self, name):
-        return quote_identifier(name)
+    _quote_identifier = staticmethod(quote_identifier)
 
 
 class ClickhouseExprTranslator(ExprTranslator):
@@ -1,11 +1,10 @@
 from typing import Dict
 
-import toolz
 from dask.dataframe import DataFrame
 
 import ibis.config
 from ibis.backends.base import BaseBackend
-from ibis.backends.pandas import _flatten_subclass_tree
+from ibis.backends.pandas import _DispatchedOperations
 
 from . import udf  # noqa: F401,F403 - register dispatchers
 from .client import DaskClient, DaskDatabase, DaskTable
@@ -13,14 +12,8 @@ from .execution import execute, execute_node  # noqa F401
 
 
 class DaskExprTranslator:
-    # get the dispatched functions from the execute_node dispatcher and compute
-    # and flatten the type tree of the first argument which is always the Node
-    # subclass
-    _registry = frozenset(
-        toolz.concat(
-            _flatten_subclass_tree(types[0]) for types in execute_node.funcs
-        )
-    )
+    # the types handled by the execute_node dispatcher, computed lazily
+    _registry = _DispatchedOperations(execute_node)
     _rewrites = {}
 
 
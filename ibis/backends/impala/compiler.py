@@ -61,8 +61,7 @@ class ImpalaTableSetFormatter(TableSetFormatter):
 
         return jname
 
-    def _quote_identifier(self, name):
-        return quote_identifier(name)
+    _quote_identifier = staticmethod(quote_identifier)
 
 
 class ImpalaQueryContext(QueryContext):
@@ -58,6 +58,8 @@ class MySQLClient(AlchemyClient):
     con : sqlalchemy.engine.Engine
     """
 
+    supports_server_side_cursors = True
+
     def __init__(
         self,
         backend,
@@ -208,11 +210,11 @@ class MySQLClient(AlchemyClient):
             node = self.table_class(alch_table, self, self._schemas.get(name))
             return self.table_expr_class(node)
 
-    def list_tables(self, like=None, database=None, schema=None):
+    def list_tables(self, like=None, database=None, schema=None, kind='both'):
         if database is not None and database != self.current_database:
             return self.database(name=database).list_tables(
-                like=like, schema=schema
+                like=like, schema=schema, kind=kind
             )
         else:
             parent = super(MySQLClient, self)
-            return parent.list_tables(like=like, schema=schema)
+            return parent.list_tables(like=like, schema=schema, kind=kind)
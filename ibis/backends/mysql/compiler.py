@@ -1,3 +1,5 @@
+import types
+
 import sqlalchemy.dialects.mysql as mysql
 
 import ibis.expr.datatypes as dt
@@ -13,9 +15,11 @@ def add_operation(op, translation_func):
 class MySQLExprTranslator(AlchemyExprTranslator):
     _registry = operation_registry
     _rewrites = AlchemyExprTranslator._rewrites.copy()
-    _type_map = AlchemyExprTranslator._type_map.copy()
-    _type_map.update(
+    # read-only, so the type map shared by every translator can't be
+    # modified by accident
+    _type_map = types.MappingProxyType(
         {
+            **AlchemyExprTranslator._type_map,
             dt.Boolean: mysql.BOOLEAN,
             dt.Int8: mysql.TINYINT,
             dt.Int32: mysql.INTEGER,
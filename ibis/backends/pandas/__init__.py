@@ -1,5 +1,3 @@
-import toolz
-
 import ibis.config
 from ibis.backends.base import BaseBackend
 
@@ -8,31 +6,53 @@ from .execution import execute, execute_node
 from .udf import udf  # noqa F401
 
 
-def _flatten_subclass_tree(cls):
-    """Return the set of all child classes of `cls`.
+def _flatten_subclass_tree(*classes):
+    """Return the set of `classes` and all of their child classes.
 
     Parameters
     ----------
-    cls : Type
+    classes : Type
 
     Returns
     -------
     frozenset[Type]
     """
-    subclasses = frozenset(cls.__subclasses__())
-    children = frozenset(toolz.concat(map(_flatten_subclass_tree, subclasses)))
-    return frozenset({cls}) | subclasses | children
+    # classes already in the result had their whole subtree added with them,
+    # so every class is only expanded once, even in overlapping hierarchies
+    result = set()
+    stack = list(classes)
+    while stack:
+        cls = stack.pop()
+        if cls not in result:
+            result.add(cls)
+            stack.extend(cls.__subclasses__())
+    return frozenset(result)
+
+
+class _DispatchedOperations:
+    """The operation types handled by an ``execute_node`` dispatcher.
+
+    The set is computed on first access rather than at import time, since
+    flattening the subclass tree of every dispatched type is expensive.
+    """
+
+    def __init__(self, execute_node):
+        self.execute_node = execute_node
+        self.operations = None
+
+    def __get__(self, instance, owner):
+        if self.operations is None:
+            # the first argument of each dispatched function is always the
+            # Node subclass
+            self.operations = _flatten_subclass_tree(
+                *(types[0] for types in self.execute_node.funcs)
+            )
+        return self.operations
 
 
 class PandasExprTranslator:
-    # get the dispatched functions from the execute_node dispatcher and compute
-    # and flatten the type tree of the first argument which is always the Node
-    # subclass
-    _registry = frozenset(
-        toolz.concat(
-            _flatten_subclass_tree(types[0]) for types in execute_node.funcs
-        )
-    )
+    # the types handled by the execute_node dispatcher, computed lazily
+    _registry = _DispatchedOperations(execute_node)
     _rewrites = {}
 
 
@@ -98,7 +98,7 @@ rewrites = SparkExprTranslator.rewrites
 @rewrites(ops.IsInf)
 def spark_rewrites_is_inf(expr):
     arg = expr.op().arg
-    return (arg == ibis.literal(math.inf)) | (arg == ibis.literal(-math.inf))
+    return arg.abs() == ibis.literal(math.inf)
 
 
 class SparkSelect(Select):
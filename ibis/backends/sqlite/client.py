@@ -375,11 +375,8 @@ class SQLiteClient(AlchemyClient):
         return self
 
     def _get_sqla_table(self, name, schema=None, autoload=True):
-        return sa.Table(
-            name,
-            self.meta,
-            schema=schema or self.current_database,
-            autoload=autoload,
+        return super()._get_sqla_table(
+            name, schema=schema or self.current_database, autoload=autoload
         )
 
     def table(self, name, database=None):
@@ -402,10 +399,10 @@ class SQLiteClient(AlchemyClient):
         node = self.table_class(alch_table, self)
         return self.table_expr_class(node)
 
-    def list_tables(self, like=None, database=None, schema=None):
+    def list_tables(self, like=None, database=None, schema=None, kind='both'):
         if database is None:
             database = self.database_name
-        return super().list_tables(like, schema=database)
+        return super().list_tables(like, schema=database, kind=kind)
 
     def _table_from_schema(
         self, name, schema, database: Optional[str] = None
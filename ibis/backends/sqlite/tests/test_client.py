@@ -1,7 +1,9 @@
 import os
+import re
 import uuid
 
 import numpy as np
+import pandas as pd
 import pandas.testing as tm
 import pytest
 
@@ -27,6 +29,51 @@ def test_file_not_exist_and_create():
         os.remove(path)
 
 
+def test_dialect_is_cached():
+    from ibis.backends.base.sql.alchemy import AlchemyDialect
+    from ibis.backends.sqlite.compiler import SQLiteExprTranslator
+
+    dialect = ibis.sqlite.dialect
+    assert dialect is ibis.sqlite.dialect
+    assert issubclass(dialect, AlchemyDialect)
+    assert dialect.translator is SQLiteExprTranslator
+    # the shared base class must not be mutated
+    assert AlchemyDialect.translator is not SQLiteExprTranslator
+
+
+def test_compile_is_cached():
+    t = ibis.table([('a', 'int64'), ('b', 'string')], name='t')
+    expr = t[t.a > 1].b.length().sum()
+    result = ibis.sqlite.compile(expr)
+    assert ibis.sqlite.compile(t[t.a > 1].b.length().sum()) is result
+
+    ibis.sqlite.invalidate_compile_cache()
+    assert ibis.sqlite.compile(expr) is not result
+
+
+def test_compile_cache_tracks_translation_rules():
+    import sqlalchemy as sa
+
+    import ibis.expr.operations as ops
+    from ibis.backends.sqlite.compiler import SQLiteExprTranslator
+
+    t = ibis.table([('a', 'string')], name='t')
+    expr = t.a.length()
+    assert 'length' in str(ibis.sqlite.compile(expr))
+
+    def my_length(translator, expr):
+        (arg,) = expr.op().args
+        return sa.func.my_length(translator.translate(arg))
+
+    original = SQLiteExprTranslator._registry[ops.StringLength]
+    SQLiteExprTranslator.add_operation(ops.StringLength, my_length)
+    try:
+        assert 'my_length' in str(ibis.sqlite.compile(expr))
+    finally:
+        SQLiteExprTranslator.add_operation(ops.StringLength, original)
+    assert 'my_length' not in str(ibis.sqlite.compile(expr))
+
+
 def test_table(con):
     table = con.table('functional_alltypes')
     assert isinstance(table, ir.TableExpr)
@@ -57,6 +104,30 @@ def test_list_tables(con):
     assert len(con.list_tables(like='functional')) == 1
 
 
+def test_list_tables_kind(tmpdir):
+    client = ibis.sqlite.connect(str(tmpdir.join('test.db')), create=True)
+    client.create_table('t', schema=ibis.schema([('a', 'int64')]))
+    client.raw_sql('CREATE VIEW base.v AS SELECT a FROM base.t')
+
+    assert client.list_tables() == ['t', 'v']
+    assert client.list_tables(kind='table') == ['t']
+    assert client.list_tables(kind='view') == ['v']
+
+    with pytest.raises(ValueError):
+        client.list_tables(kind='index')
+
+
+def test_list_tables_like(tmpdir):
+    client = ibis.sqlite.connect(str(tmpdir.join('test.db')), create=True)
+    for name in ('foo_a', 'bar_b', 'baz_c'):
+        client.create_table(name, schema=ibis.schema([('a', 'int64')]))
+
+    assert client.list_tables(like='ba') == ['bar_b', 'baz_c']
+    assert client.list_tables(like=['foo', '_c']) == ['baz_c', 'foo_a']
+    assert client.list_tables(like=re.compile('^ba.*b$')) == ['bar_b']
+    assert client.list_tables(like=[]) == []
+
+
 def test_compile_verify(alltypes):
     unsupported_expr = alltypes.string_col.approx_nunique()
     assert not unsupported_expr.verify()
@@ -77,6 +148,70 @@ def test_attach_file(dbpath):
     assert foo_tables == bar_tables
 
 
+def test_reflected_tables_are_cached(tmpdir):
+    client = ibis.sqlite.connect(str(tmpdir.join('test.db')), create=True)
+    client.create_table('t', schema=ibis.schema([('a', 'int64')]))
+
+    table = client._get_sqla_table('t')
+    assert client._get_sqla_table('t') is table
+    assert client.table('t').columns == ['a']
+
+    # DDL on another table doesn't invalidate the cached table
+    client.create_table('u', schema=ibis.schema([('c', 'double')]))
+    assert client._get_sqla_table('t') is table
+    assert client.list_tables() == ['t', 'u']
+
+    client.drop_table('t')
+    client.create_table('t', schema=ibis.schema([('b', 'string')]))
+    assert client._get_sqla_table('t') is not table
+    assert client.table('t').columns == ['b']
+
+
+def test_raw_sql_ddl_refreshes_reflected_tables(tmpdir):
+    client = ibis.sqlite.connect(str(tmpdir.join('test.db')), create=True)
+    client.create_table('t', schema=ibis.schema([('a', 'int64')]))
+    assert client.table('t').columns == ['a']
+
+    client.raw_sql('ALTER TABLE base.t ADD COLUMN z integer')
+    assert client.table('t').columns == ['a', 'z']
+
+
+def test_create_table_refreshes_reflected_table(tmpdir):
+    client = ibis.sqlite.connect(str(tmpdir.join('test.db')), create=True)
+    assert client.list_tables() == []
+
+    client.create_table('t', schema=ibis.schema([('a', 'int64')]))
+    created = client.meta.tables['base.t']
+
+    # the table is reflected from the database rather than taken from the
+    # definition create_table used
+    table = client._get_sqla_table('t', schema='base')
+    assert table is not created
+    assert client._get_sqla_table('t', schema='base') is table
+
+
+def test_insert_reuses_compiled_select(tmpdir):
+    client = ibis.sqlite.connect(str(tmpdir.join('test.db')), create=True)
+    schema = ibis.schema([('a', 'int64')])
+    client.create_table('t', schema=schema)
+    client.create_table('u', schema=schema)
+    t = client.table('t')
+    client.insert('t', pd.DataFrame({'a': [1]}))
+
+    expr = t[t.a > 0]
+    client.insert('u', expr)
+    (compiled,) = client._compiled_selects.values()
+    client.insert('u', t[t.a > 0])
+    (cached,) = client._compiled_selects.values()
+    assert cached is compiled
+    assert len(client.table('u').execute()) == 2
+
+    client.compiled_selects_cache_size = 1
+    client.insert('u', t[t.a > 1])
+    (cached,) = client._compiled_selects.values()
+    assert cached is not compiled
+
+
 def test_database_layer(con, db):
     assert db.list_tables() == con.list_tables()
 
@@ -116,3 +251,22 @@ def test_verbose_log_queries(con):
     expected += 'FROM base.functional_alltypes AS t0\n'
     expected += ' LIMIT ? OFFSET ?'
     assert query == expected
+
+
+def test_truncate_table_deletes_rows(tmpdir):
+    client = ibis.sqlite.connect(str(tmpdir.join('test.db')), create=True)
+    assert not client.supports_truncate
+
+    client.create_table('t', schema=ibis.schema([('a', 'int64')]))
+    client.create_table('deleted', schema=ibis.schema([('a', 'int64')]))
+    client.insert('t', pd.DataFrame({'a': [1, 2]}))
+    client.raw_sql(
+        'CREATE TRIGGER base.log_delete AFTER DELETE ON t '
+        'BEGIN INSERT INTO deleted VALUES (old.a); END'
+    )
+
+    # SQLite has no TRUNCATE, so the rows are deleted one by one and the
+    # delete triggers fire
+    client.truncate_table('t')
+    assert not len(client.table('t').execute())
+    assert sorted(client.table('deleted').execute().a) == [1, 2]
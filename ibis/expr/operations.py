@@ -31,8 +31,18 @@ def distinct_roots(*expressions):
     return list(toolz.unique(roots))
 
 
+@functools.lru_cache(maxsize=None)
+def _is_flattened_type(cls):
+    # isinstance checks against collections.abc.Iterable go through
+    # ABCMeta.__instancecheck__; the answer only depends on the type, and
+    # Node.flat_args asks for every argument of every node
+    return not issubclass(cls, str) and issubclass(
+        cls, collections.abc.Iterable
+    )
+
+
 class Node(Annotable):
-    __slots__ = '_expr_cached', '_hash'
+    __slots__ = '_expr_cached', '_hash', '_flat_expr_args'
 
     def __repr__(self):
         return self._repr()
@@ -69,14 +79,23 @@ class Node(Annotable):
 
     def flat_args(self):
         for arg in self.args:
-            if not isinstance(arg, str) and isinstance(
-                arg, collections.abc.Iterable
-            ):
-                for x in arg:
-                    yield x
+            if _is_flattened_type(type(arg)):
+                yield from arg
             else:
                 yield arg
 
+    def flat_expr_args(self):
+        """Return the expressions among :meth:`flat_args`, as a tuple.
+
+        The result is cached, since the compiler walks the same nodes many
+        times.
+        """
+        if not hasattr(self, '_flat_expr_args'):
+            self._flat_expr_args = tuple(
+                arg for arg in self.flat_args() if isinstance(arg, ir.Expr)
+            )
+        return self._flat_expr_args
+
     def __hash__(self):
         if not hasattr(self, '_hash'):
             self._hash = hash(
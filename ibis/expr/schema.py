@@ -24,7 +24,7 @@ class Schema:
         representing type of each column.
     """
 
-    __slots__ = 'names', 'types', '_name_locs'
+    __slots__ = 'names', 'types', '_name_locs', '_geospatial_columns'
 
     def __init__(self, names, types):
         if not isinstance(names, list):
@@ -34,6 +34,7 @@ class Schema:
         self.types = list(map(dt.dtype, types))
 
         self._name_locs = {v: i for i, v in enumerate(self.names)}
+        self._geospatial_columns = None
 
         if len(self._name_locs) < len(self.names):
             duplicate_names = list(self.names)
@@ -121,6 +122,18 @@ class Schema:
     def items(self):
         return zip(self.names, self.types)
 
+    @property
+    def geospatial_columns(self):
+        """The names of the geospatial columns, computed on first access."""
+        columns = getattr(self, '_geospatial_columns', None)
+        if columns is None:
+            columns = self._geospatial_columns = tuple(
+                name
+                for name, dtype in self.items()
+                if isinstance(dtype, dt.GeoSpatial)
+            )
+        return columns
+
     def name_at_position(self, i):
         """
         """
@@ -166,3 +166,10 @@ def test_nullable_output():
     assert 'bar  int64[non-nullable]' in sch_str
     assert 'baz  boolean' in sch_str
     assert 'baz  boolean[non-nullable]' not in sch_str
+
+
+def test_geospatial_columns():
+    sch = ibis.schema([('geo', 'geometry'), ('a', 'int64'), ('pt', 'point')])
+    assert sch.geospatial_columns == ('geo', 'pt')
+    assert sch.geospatial_columns is sch.geospatial_columns
+    assert ibis.schema([('a', 'int64')]).geospatial_columns == ()
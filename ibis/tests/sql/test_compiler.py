@@ -2557,3 +2557,104 @@ FROM (
     ON t0.`b` = t1.`b`
 WHERE t0.`a` < 1.0"""
     assert result == expected
+
+
+def test_select_equals():
+    t = ibis.table([('a', 'int64'), ('b', 'string')], name='t')
+
+    query = _get_query(t[t.a > 1])
+    assert query.equals(query)
+    assert query.equals(_get_query(t[t.a > 1]))
+    assert not query.equals(_get_query(t[t.a > 2]))
+    assert not query.equals(_get_query(t[t.a > 1].limit(10)))
+
+
+def test_subcontexts_share_table_keys():
+    t = ibis.table([('a', 'int64'), ('b', 'string')], name='t')
+    context = BaseDialect.make_context()
+    subcontext = context.subcontext()
+
+    key = context._get_table_key(t)
+    assert subcontext._get_table_key(t) is key
+    assert subcontext.subcontext()._get_table_key(t) is key
+
+
+def test_flatten_set_operations():
+    from ibis.backends.base.sql.compiler.query_builder import (
+        flatten_difference,
+        flatten_intersection,
+        flatten_union,
+    )
+
+    schema = [('a', 'int64')]
+    t1, t2, t3 = (ibis.table(schema, name=name) for name in 'xyz')
+
+    union = t1.union(t2).union(t3, distinct=True)
+    assert flatten_union(union) == [t1, False, t2, True, t3]
+
+    # unions nested in other set operations are compiled separately
+    u = t2.union(t3)
+    intersection = t1.intersect(u).intersect(t1.intersect(t2))
+    assert flatten_intersection(intersection) == [t1, u, t1, t2]
+
+    d = t2.difference(t3)
+    difference = t1.difference(u).difference(d)
+    assert flatten_difference(difference) == [t1, u, d]
+
+
+@pytest.mark.parametrize(
+    ('join', 'predicate', 'expected'),
+    [
+        ('left_join', lambda t: t.y > 0, 'INNER JOIN'),
+        ('left_join', lambda t: t.y.between(0, 1), 'INNER JOIN'),
+        ('left_join', lambda t: (t.y + 1).isin([1, 2]), 'INNER JOIN'),
+        ('left_join', lambda t: t.x > 0, 'LEFT OUTER JOIN'),
+        ('left_join', lambda t: t.y.isnull(), 'LEFT OUTER JOIN'),
+        ('left_join', lambda t: (t.y > 0) | (t.x > 0), 'LEFT OUTER JOIN'),
+        ('outer_join', lambda t: t.x > 0, 'LEFT OUTER JOIN'),
+        ('outer_join', lambda t: t.y > 0, 'RIGHT OUTER JOIN'),
+        ('outer_join', lambda t: (t.x > 0) & (t.y > 0), 'INNER JOIN'),
+    ],
+)
+def test_null_rejecting_filter_reduces_outer_join(join, predicate, expected):
+    a = ibis.table([('k', 'int64'), ('x', 'double')], name='a')
+    b = ibis.table([('k2', 'int64'), ('y', 'double')], name='b')
+    joined = getattr(a, join)(b, a.k == b.k2)
+    expr = joined[a, b.y].filter(predicate)
+
+    result = to_sql(expr)
+    assert f'\n  {expected} b t1\n' in result
+
+
+def test_null_rejecting_filter_reduces_outer_join_under_cross_join():
+    a = ibis.table([('k', 'int64'), ('x', 'double')], name='a')
+    b = ibis.table([('k2', 'int64'), ('y', 'double')], name='b')
+    c = ibis.table([('z', 'double')], name='c')
+    joined = a.left_join(b, a.k == b.k2).cross_join(c)
+    expr = joined[a, b.y, c.z].filter(b.y > 0)
+
+    result = to_sql(expr)
+    assert '\n  INNER JOIN b t1\n' in result
+    assert '\n  CROSS JOIN c t2\n' in result
+
+
+def test_null_rejecting_filter_reduces_outer_join_under_asof_join():
+    from ibis.backends.base.sql.compiler.query_builder import SelectBuilder
+
+    a = ibis.table(
+        [('k', 'int64'), ('time', 'timestamp'), ('x', 'double')], name='a'
+    )
+    b = ibis.table([('k2', 'int64'), ('y', 'double')], name='b')
+    c = ibis.table([('time', 'timestamp'), ('k', 'int64')], name='c')
+    joined = a.left_join(b, a.k == b.k2).asof_join(
+        c, a.time == c.time, by=a.k == c.k, tolerance=ibis.interval(days=1)
+    )
+
+    # no SQL backend compiles asof joins, so check the rewritten join itself
+    result = SelectBuilder._reduce_outer_joins(joined, {b.op()}).op()
+    op = joined.op()
+    assert type(result) is ops.AsOfJoin
+    assert type(result.left.op()) is ops.InnerJoin
+    assert result.right.equals(op.right)
+    assert result.by == op.by
+    assert result.tolerance.equals(op.tolerance)
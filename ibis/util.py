@@ -50,8 +50,12 @@ def indent(text: str, spaces: int) -> str:
     -------
     string
     """
+    if not text:
+        return text
     prefix = ' ' * spaces
-    return ''.join(prefix + line for line in text.splitlines(True))
+    # joining on the prefix puts it after every line break, so only the first
+    # line needs it prepended
+    return prefix + prefix.join(text.splitlines(True))
 
 
 def is_one_of(values: Sequence[T], t: Type[U]) -> Iterator[bool]: